@@ -1,9 +1,36 @@
+from typing import Set, Tuple, Optional
+
 from sr.robot import Robot
 from controller import Keyboard
 
 KEYBOARD_SAMPLING_FREQUENCY = 16
 NO_KEY_PRESSED = -1
 
+# Motor powers for each of the movement keys. Where several are held at once
+# the first in this mapping wins.
+MOVEMENT_KEYS = {
+    ord('W'): (50, 50),
+    ord('S'): (-50, -50),
+    ord('A'): (-25, 25),
+    ord('D'): (25, -25),
+}
+STOPPED = (0, 0)
+
+KEY_CLAIM_TERRITORY = ord('E')
+KEY_DISTANCE_SENSORS = ord('Q')
+
+
+def get_pressed_keys(keyboard: Keyboard) -> Set[int]:
+    pressed = set()
+
+    # Work our way through all the currently pressed keys
+    key = keyboard.getKey()
+    while key != NO_KEY_PRESSED:
+        pressed.add(key)
+        key = keyboard.getKey()
+
+    return pressed
+
 
 def print_distance_sensors(robot: Robot) -> None:
     distance_sensor_names = [
@@ -33,40 +60,31 @@ print(
     "up by webots",
 )
 
-while True:
-    key = keyboard.getKey()
-
-    if key == NO_KEY_PRESSED:
-        R.motors[0].m0.power = 0
-        R.motors[0].m1.power = 0
+previous_keys: Set[int] = set()
+motor_powers: Optional[Tuple[int, int]] = None
 
-    else:
-        while key != NO_KEY_PRESSED:
-
-            if key == ord('W'):
-                R.motors[0].m0.power = 50
-                R.motors[0].m1.power = 50
-
-            elif key == ord('S'):
-                R.motors[0].m0.power = -50
-                R.motors[0].m1.power = -50
+while True:
+    keys = get_pressed_keys(keyboard)
 
-            elif key == ord('A'):
-                R.motors[0].m0.power = -25
-                R.motors[0].m1.power = 25
+    # Only act on the action keys when they're first pressed, rather than on
+    # every timestep for which they're held.
+    new_keys = keys - previous_keys
+    previous_keys = keys
 
-            elif key == ord('D'):
-                R.motors[0].m0.power = 25
-                R.motors[0].m1.power = -25
+    new_motor_powers = next(
+        (powers for key, powers in MOVEMENT_KEYS.items() if key in keys),
+        STOPPED,
+    )
 
-            elif key == ord('E'):
-                R.radio.claim_territory()
+    # Only update the motors when the powers actually change
+    if new_motor_powers != motor_powers:
+        motor_powers = new_motor_powers
+        R.motors[0].m0.power, R.motors[0].m1.power = motor_powers
 
-            elif key == ord('Q'):
-                print_distance_sensors(R)
+    if KEY_CLAIM_TERRITORY in new_keys:
+        R.radio.claim_territory()
 
-            # Work our way through all the enqueued key presses before dropping
-            # out to the timestep
-            key = keyboard.getKey()
+    if KEY_DISTANCE_SENSORS in new_keys:
+        print_distance_sensors(R)
 
     R.sleep(KEYBOARD_SAMPLING_FREQUENCY / 1000)